@@ -3,41 +3,96 @@
 Analyze what's actually in the OpenAI Ashby page
 """
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
 import re
+from collections import Counter
+from itertools import islice
 
-def analyze_ashby_page():
+ASHBY_URL = "https://jobs.ashbyhq.com/openai/?departmentId=db3c67d7-3646-4555-925b-40f30ab09f28"
+
+# Only the start of a page is needed for diagnostics
+MAX_BODY_BYTES = 200_000
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+# One keep-alive session shared by every diagnostic fetch
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+
+# Job titles that might be embedded in the raw HTML
+JOB_TITLE_PATTERNS = [
+    re.compile(pattern, re.I) for pattern in (
+        r'product\s+manager[^"]*',
+        r'senior\s+product[^"]*',
+        r'principal\s+product[^"]*',
+        r'director[^"]*product[^"]*'
+    )
+]
+
+# Script-body markers for each JS framework we try to detect
+JS_FRAMEWORK_INDICATORS = {
+    'Next.js': re.compile(r'__NEXT_DATA__'),
+    'React': re.compile(r'react', re.I),
+    'SPA': re.compile(r'_app|chunks'),
+}
+
+# Inline script bodies in the raw page, and the job-data markers looked for in them
+SCRIPT_BODY = re.compile(rb'<script\b[^>]*>(.*?)</script\s*>', re.I | re.S)
+PRODUCT_MARKER = re.compile(rb'product', re.I)
+JOB_MARKER = re.compile(rb'manager|job', re.I)
+
+# First line mentioning both "product" and "manager", in any case
+PM_SAMPLE_LINE = re.compile(r'^.*(?:product.*manager|manager.*product).*$', re.I | re.M)
+
+def fetch_page(url):
+    """Fetch a page for analysis, reading at most MAX_BODY_BYTES of its body.
+    Also returns whether the page went on past that cap"""
+    with SESSION.get(url, timeout=30, stream=True) as response:
+        body = response.raw.read(MAX_BODY_BYTES, decode_content=True)
+        truncated = len(body) == MAX_BODY_BYTES and bool(response.raw.read(1, decode_content=True))
+    return response, body, truncated
+
+def analyze_ashby_page(url=ASHBY_URL):
     """Analyze the OpenAI Ashby page content"""
-    url = "https://jobs.ashbyhq.com/openai/?departmentId=db3c67d7-3646-4555-925b-40f30ab09f28"
-    
     print(f"🔍 ASHBY PAGE ANALYSIS")
     print(f"URL: {url}")
     print(f"="*60)
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response, body, truncated = fetch_page(url)
         print(f"📡 Status: {response.status_code}")
-        print(f"📄 Content length: {len(response.text):,} chars")
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        content_length = response.headers.get('Content-Length')
+        if content_length:
+            print(f"📄 Content length: {int(content_length):,} bytes (as sent)")
+        else:
+            print(f"📄 Content length: not reported by the server")
+        if truncated:
+            print(f"⚠️  Body truncated: analyzing only the first {len(body):,} bytes, "
+                  f"so anything reported missing below may just be further into the page")
+        else:
+            print(f"📄 Analyzing the full body: {len(body):,} bytes")
+        
+        # Misses below only cover the part of the page that was read
+        scope = f" (in the first {len(body):,} bytes)" if truncated else ""
+        
+        encoding = response.encoding or 'utf-8'
+        tree = lxml.html.fromstring(body)
         
         # Check what's actually in the page
         print(f"\n📝 Page structure analysis:")
         
-        # Count different element types
+        # Count different element types, collecting scripts in the same walk of the tree
+        tag_counts = Counter()
+        scripts = []
+        for element in tree.iter():
+            tag_counts[element.tag] += 1
+            if element.tag == 'script':
+                scripts.append(element)
         elements_count = {
-            'div': len(soup.find_all('div')),
-            'a': len(soup.find_all('a')),
-            'script': len(soup.find_all('script')),
-            'h1': len(soup.find_all('h1')),
-            'h2': len(soup.find_all('h2')),
-            'h3': len(soup.find_all('h3')),
-            'span': len(soup.find_all('span')),
-            'p': len(soup.find_all('p'))
+            tag: tag_counts[tag]
+            for tag in ('div', 'a', 'script', 'h1', 'h2', 'h3', 'span', 'p')
         }
         
         for element, count in elements_count.items():
@@ -45,76 +100,69 @@ def analyze_ashby_page():
         
         # Check if it's a single-page app
         print(f"\n⚡ JavaScript analysis:")
-        scripts = soup.find_all('script')
-        
-        # Look for Next.js or React indicators
-        js_frameworks = []
+        # Look for Next.js or React indicators, stopping once every framework is seen
+        js_frameworks = set()
+        remaining = dict(JS_FRAMEWORK_INDICATORS)
         for script in scripts:
-            script_content = script.get_text() if script.string else ""
-            if '__NEXT_DATA__' in script_content:
-                js_frameworks.append('Next.js')
-            if 'react' in script_content.lower():
-                js_frameworks.append('React')
-            if '_app' in script_content or 'chunks' in script_content:
-                js_frameworks.append('SPA')
+            script_content = script.text or ""
+            for framework, indicator in list(remaining.items()):
+                if indicator.search(script_content):
+                    js_frameworks.add(framework)
+                    del remaining[framework]
+            if not remaining:
+                break
         
-        print(f"Detected frameworks: {list(set(js_frameworks))}")
+        print(f"Detected frameworks: {sorted(js_frameworks)}")
         
         # Check for job data in script tags (Next.js often embeds data)
         print(f"\n🔍 Looking for job data in scripts:")
-        job_data_found = False
-        
-        for script in scripts:
-            script_text = script.get_text() if script.string else ""
-            if 'product' in script_text.lower() and ('manager' in script_text.lower() or 'job' in script_text.lower()):
-                job_data_found = True
-                print(f"✅ Found job-related data in script tag")
-                # Extract a sample
-                lines = script_text.split('\n')
-                for line in lines:
-                    if 'product' in line.lower() and 'manager' in line.lower():
-                        print(f"   Sample: {line.strip()[:100]}...")
-                        break
+        # Scan script bodies in place on the raw bytes; no per-script copies
+        job_data_script = None
+        for script in SCRIPT_BODY.finditer(body):
+            start, end = script.span(1)
+            if PRODUCT_MARKER.search(body, start, end) and JOB_MARKER.search(body, start, end):
+                job_data_script = body[start:end].decode(encoding, errors='replace')
                 break
         
-        if not job_data_found:
-            print(f"❌ No job data found in script tags")
+        if job_data_script:
+            print(f"✅ Found job-related data in script tag")
+            # Extract a sample
+            sample = PM_SAMPLE_LINE.search(job_data_script)
+            if sample:
+                print(f"   Sample: {sample.group(0).strip()[:100]}...")
+        else:
+            print(f"❌ No job data found in script tags{scope}")
         
         # Check the raw HTML for any obvious job titles
         print(f"\n🎯 Raw HTML text search:")
-        raw_text = response.text
-        
-        # Look for job titles that might be embedded
-        job_title_patterns = [
-            r'product\s+manager[^"]*',
-            r'senior\s+product[^"]*',
-            r'principal\s+product[^"]*',
-            r'director[^"]*product[^"]*'
-        ]
-        
-        for pattern in job_title_patterns:
-            matches = re.findall(pattern, raw_text, re.I)
-            if matches:
-                print(f"✅ Pattern '{pattern}' found {len(matches)} times:")
-                for match in matches[:3]:
+        raw_text = body.decode(encoding, errors='replace')
+        
+        for pattern in JOB_TITLE_PATTERNS:
+            # Keep the first three matches for display and only count the rest
+            found = pattern.finditer(raw_text)
+            samples = [match.group(0) for match in islice(found, 3)]
+            if samples:
+                total = len(samples) + sum(1 for _ in found)
+                print(f"✅ Pattern '{pattern.pattern}' found {total} times:")
+                for match in samples:
                     print(f"   • {match}")
             else:
-                print(f"❌ Pattern '{pattern}': no matches")
+                print(f"❌ Pattern '{pattern.pattern}': no matches{scope}")
         
         # Check if there's an API endpoint we can try
         print(f"\n🔌 Looking for API patterns:")
-        api_indicators = ['/api/jobs', '/api/postings', 'ashby.com/api', 'fetch(']
+        api_indicators = [b'/api/jobs', b'/api/postings', b'ashby.com/api', b'fetch(']
         
         for indicator in api_indicators:
-            if indicator in raw_text:
-                print(f"✅ Found API indicator: {indicator}")
+            if indicator in body:
+                print(f"✅ Found API indicator: {indicator.decode()}")
             else:
-                print(f"❌ No {indicator}")
+                print(f"❌ No {indicator.decode()}{scope}")
         
         # Save a sample of the HTML for manual inspection
-        with open('ashby_sample.html', 'w', encoding='utf-8') as f:
-            f.write(raw_text[:50000])  # First 50k chars
-        print(f"\n💾 Saved first 50k chars to ashby_sample.html")
+        with open('ashby_sample.html', 'wb') as f:
+            f.write(body[:50000])  # First 50k bytes, as received
+        print(f"\n💾 Saved first 50k bytes to ashby_sample.html")
         
     except Exception as e:
         print(f"❌ Error: {e}")
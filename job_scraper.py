@@ -5,27 +5,298 @@ Modular parser system for different ATS platforms
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 import csv
 import time
 import hashlib
+import html
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import os
 import logging
 import re
+import string
+import threading
+from bisect import bisect_right
+from collections import Counter, deque
+from operator import itemgetter
 from pathlib import Path
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlparse, urljoin, parse_qs
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Maximum number of hosts scraped concurrently
+MAX_SCRAPE_WORKERS = 8
+
+# Most job elements parsed per generic board, to prevent overload
+MAX_JOB_ELEMENTS = 50
+
+# Seconds to wait between consecutive requests to the same host
+REQUEST_DELAY = 3
+
+# User-Agent sent with every request
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Column order for jobs.csv, matching the job dicts the parsers build
+JOB_FIELDS = ['company', 'title', 'location', 'url', 'date_posted', 'date_found', 'status', 'hash']
+
+# Size in bytes of a job's blake2b hash; stored as hex, so its text is twice as long.
+# Hashes of any other length (the old 12-char md5 ones) are from an earlier scheme
+JOB_HASH_SIZE = 8
+
+# URL fragments that mark a link as something other than a job posting
+EXCLUDED_URL_PATTERNS = [
+    '/product-managers/', '/about-product', '/what-is-product', '/product-management-guide',
+    '/blog/', '/resources/', '/tools/', '/templates/', '/product-development/',
+    '/product/', '/customers/', '/features/', '/stories/', '/case-studies/',
+    '/solutions/', '/pricing/', 'forbes.com', 'techcrunch.com', 'medium.com',
+    '/company/', '/about/', '/contact/', '/support/', '.pdf', '.jpg', '.png', '.gif'
+]
+
+# URL fragments that look like job listings
+JOB_URL_PATTERNS = [
+    '/jobs/', '/careers/', '/job/', '/career/', '/positions/', '/listing/',
+    '/opening/', '/vacancy/', '/role/', 'greenhouse.io', 'lever.co', 
+    'workday', 'ashbyhq.com'
+]
+
+# Title fragments that mark a Product Manager role
+PM_TITLE_PATTERNS = [
+    'product manager', 'product management', 'pm,', '- pm', '(pm)', 
+    'senior pm', 'principal pm', 'staff pm', 'group pm',
+    'director of product', 'director, product', 'director product',
+    'head of product', 'vp product', 'vp of product', 'product lead',
+    'product owner', 'associate pm', 'junior pm', 'lead pm',
+    'product management', 'pm -', 'pm lead', 'pm director'
+]
+
+# Title fragments for non-PM roles, even if they have "product" in the title
+EXCLUDED_TITLE_PATTERNS = [
+    'engineer', 'engineering manager', 'frontend', 'backend', 'developer',
+    'designer', 'design', 'marketing manager', 'sales', 'customer success',
+    'support', 'data analyst', 'intern', 'qa', 'test', 'devops', 
+    'data scientist', 'recruiter', 'account executive', 'content writer',
+    'researcher', 'research scientist', 'technical writer', 'program manager',
+    'project manager', 'operations manager', 'business development', 
+    'partnerships manager', 'growth marketing', 'strategist', 'evangelist'
+]
+
+
+def _alternation(fragments: List[str], *extra: str) -> str:
+    """Join literal fragments (plus optional raw patterns) into one regex alternation"""
+    return '|'.join([re.escape(fragment) for fragment in fragments] + list(extra))
+
+
+# Compiled once at import so each filter is a single C-level regex scan
+_EXCLUDED_URL_RE = re.compile(_alternation(EXCLUDED_URL_PATTERNS))
+_JOB_URL_RE = re.compile(_alternation(JOB_URL_PATTERNS))
+
+# Classifies a title in one pass: the zero-width lookahead is tried at every
+# position, exclusions first, so overlapping fragments are never skipped.
+# "PM" also counts as a standalone word (e.g., "PM, ChatGPT" or "ChatGPT PM")
+_TITLE_SCAN_RE = re.compile('(?=(?P<exclude>%s)|(?P<pm>%s))' % (
+    _alternation(EXCLUDED_TITLE_PATTERNS),
+    _alternation(PM_TITLE_PATTERNS, r'\bpm\b'),
+))
+
+# Job cards and links only ever live in <body>, so the (often script- and
+# style-heavy) <head> is never built into the soup
+_BODY_ONLY = SoupStrainer('body')
+
+# Fallback link filters used when a board has no recognizable job cards
+_GREENHOUSE_LINK_TEXT_RE = re.compile(_alternation(['manager', 'product', 'director']))
+_FALLBACK_JOB_URL_RE = re.compile(_alternation(['/jobs/listing/', '/careers/', '/job/', '/opening/', 'jobs/results/']))
+_FALLBACK_JOB_TEXT_RE = re.compile(_alternation(['manager', 'product', 'director', 'lead', 'senior', 'principal', 'staff']))
+_FALLBACK_JOB_ARIA_RE = re.compile(_alternation(['manager', 'product', 'director', 'lead', 'senior']))
+
+# URLs each dedicated parser handles, checked in parser order so the first match wins
+_ASHBY_URL_RE = re.compile(r'ashbyhq\.com')
+_GREENHOUSE_URL_RE = re.compile(r'greenhouse\.io')
+
+_ASHBY_ORG_RE = re.compile(r'ashbyhq\.com/([^/?]+)')
+
+# Relative ("3 days ago") and numeric (MM/DD/YYYY) posting dates
+_TIME_AGO_RE = re.compile(r'(\d+)\s+(day|week|month)s?\s+ago')
+_TIME_AGO_UNITS = {
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),  # Approximate
+}
+_DATE_SLASH_RE = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})')
+
+# Every date snippet below needs a digit or "today"/"yesterday", so text
+# without either can skip them all
+_DATE_HINT_RE = re.compile(r'\d|today|yesterday', re.I)
+
+# Date snippets looked for in a job card's text, in priority order
+_DATE_POSTED_RES = [
+    re.compile(pattern, re.I) for pattern in (
+        r'(\d{1,2})\s+(days?|weeks?|months?)\s+ago',
+        r'(yesterday|today)',
+        r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{2,4}'
+    )
+]
+
+# Location snippets looked for in a job card's text, in priority order.
+# "City, ST" needs no pattern of its own: "City, State/Country" matches it first
+_LOCATION_RES = [
+    re.compile(pattern, re.I) for pattern in (
+        r'([A-Za-z\s]+,\s*[A-Z]{2,})',  # City, State/Country
+        r'(Remote)',
+        r'(New York|San Francisco|London|Berlin|Toronto|Seattle|Boston|Austin)'
+    )
+]
+
+# Class names that mark a job card's title and location elements
+_TITLE_CLASS_RE = re.compile(r'title|job-title|position|role-title|QJPWVe', re.I)
+_CARD_LOCATION_CLASS_RE = re.compile(r'location|city|office|geo', re.I)
+
+# Title slug in Google job URLs: /jobs/results/ID-job-title-slug
+_GOOGLE_JOB_SLUG_RE = re.compile(r'jobs/results/\d+-(.+?)(?:\?|$)')
+
+# Ashby job board GraphQL endpoint, and the query and headers sent with every request to it
+ASHBY_API_URL = "https://jobs.ashbyhq.com/api/non-user-graphql?op=ApiJobBoardWithTeams"
+
+ASHBY_QUERY = """
+query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
+  jobBoard: jobBoardWithTeams(
+    organizationHostedJobsPageName: $organizationHostedJobsPageName
+  ) {
+    teams {
+      id
+      name
+      parentTeamId
+      __typename
+    }
+    jobPostings {
+      id
+      title
+      teamId
+      locationId
+      locationName
+      workplaceType
+      employmentType
+      secondaryLocations {
+        locationId
+        locationName
+        __typename
+      }
+      compensationTierSummary
+      __typename
+    }
+    __typename
+  }
+}
+"""
+
+ASHBY_HEADERS = {
+    'Content-Type': 'application/json',
+    'apollographql-client-name': 'frontend_non_user',
+    'apollographql-client-version': '0.1.0',
+    'Accept': '*/*',
+    'Origin': 'https://jobs.ashbyhq.com',
+}
+
+# Greenhouse job board JSON API, keyed by the board token in the board's URL
+# https://job-boards.greenhouse.io/anthropic/?departments%5B%5D=... -> anthropic
+GREENHOUSE_API_URL = "https://boards-api.greenhouse.io/v1/boards"
+_GREENHOUSE_BOARD_RE = re.compile(r'greenhouse\.io/(?!embed\b)([^/?#]+)')
+
+# A single Greenhouse posting's URL, keyed by its posting id:
+# https://job-boards.greenhouse.io/anthropic/jobs/5254623008 -> 5254623008
+_GREENHOUSE_POSTING_RE = re.compile(r'greenhouse\.io/[^/?#]+/jobs/(\d+)')
+
+
+def _greenhouse_posting_id(job: Dict) -> Optional[str]:
+    """A Greenhouse job's posting id, as stored from the API or read from its board URL"""
+    posting_id = job.get('greenhouse_id')
+    if posting_id is None:
+        posting_match = _GREENHOUSE_POSTING_RE.search(job['url'])
+        posting_id = posting_match.group(1) if posting_match else None
+    return posting_id
+
+
+def _is_candidate_job_link(tag) -> bool:
+    """Check whether a tag is a link whose URL, text or aria-label looks job-related"""
+    if tag.name != 'a' or not tag.has_attr('href'):
+        return False
+    
+    return bool(_FALLBACK_JOB_URL_RE.search(tag.get('href', '')) or
+                _FALLBACK_JOB_TEXT_RE.search(tag.get_text().lower()) or
+                _FALLBACK_JOB_ARIA_RE.search(tag.get('aria-label', '').lower()))
+
+
+def _has_location_class(tag) -> bool:
+    """Check whether any of a tag's classes mentions "location", in any case"""
+    return any('location' in css_class.lower() for css_class in tag.get('class', ()))
+
+
+def _has_class_matching(tag, pattern: re.Pattern) -> bool:
+    """Check whether any of a tag's classes matches `pattern`, like `find(class_=pattern)`"""
+    return any(pattern.search(css_class) for css_class in tag.get('class', ()))
+
+
+class HostRateLimiter:
+    """Spaces out requests to each host by at least `delay` seconds, across threads"""
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._next_ok: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def wait(self, url: str):
+        """Block until a request to the host of `url` is allowed, reserving its slot"""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            ready = max(now, self._next_ok.get(host, now))
+            self._next_ok[host] = ready + self.delay
+        
+        # Sleep outside the lock so other hosts are never held up
+        if ready > now:
+            time.sleep(ready - now)
+
+
+class PoliteSession(requests.Session):
+    """Session that rate-limits each host it talks to, and only that host"""
+    
+    def __init__(self, delay: float = REQUEST_DELAY):
+        super().__init__()
+        self.rate_limiter = HostRateLimiter(delay)
+    
+    def request(self, method, url, *args, **kwargs):
+        self.rate_limiter.wait(url)
+        return super().request(method, url, *args, **kwargs)
+
+
+def create_session() -> requests.Session:
+    """Create a keep-alive, per-host rate-limited HTTP session that retries transient failures"""
+    session = PoliteSession()
+    session.headers.update({'User-Agent': USER_AGENT})
+    # The Ashby GraphQL POST only reads data, so it is as safe to retry as a GET
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                  allowed_methods=frozenset(['GET', 'POST']))
+    adapter = HTTPAdapter(pool_connections=MAX_SCRAPE_WORKERS, pool_maxsize=MAX_SCRAPE_WORKERS,
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 class BaseParser(ABC):
     """Abstract base class for job parsers"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session if session is not None else create_session()
         self.product_mgmt_keywords = [
             'product manager', 'product management', 'senior product manager',
             'principal product manager', 'product lead', 'product owner',
@@ -46,163 +317,125 @@ class BaseParser(ABC):
     
     def is_product_management_job(self, title: str, url: str = "", description: str = "") -> bool:
         """Check if job title/description matches Product Management criteria"""
-        # Filter out non-job URLs
-        excluded_url_patterns = [
-            '/product-managers/', '/about-product', '/what-is-product', '/product-management-guide',
-            '/blog/', '/resources/', '/tools/', '/templates/', '/product-development/',
-            '/product/', '/customers/', '/features/', '/stories/', '/case-studies/',
-            '/solutions/', '/pricing/', 'forbes.com', 'techcrunch.com', 'medium.com',
-            '/company/', '/about/', '/contact/', '/support/', '.pdf', '.jpg', '.png', '.gif'
-        ]
-        
-        for pattern in excluded_url_patterns:
-            if pattern in url.lower():
+        # Title-only checks (no URL) skip the URL filters entirely
+        if url:
+            url_lower = url.lower()
+            
+            # Filter out non-job URLs
+            if _EXCLUDED_URL_RE.search(url_lower):
+                return False
+            
+            # Only consider URLs that look like job listings
+            if not _JOB_URL_RE.search(url_lower):
                 return False
         
-        # Only consider URLs that look like job listings
-        job_url_patterns = [
-            '/jobs/', '/careers/', '/job/', '/career/', '/positions/', '/listing/',
-            '/opening/', '/vacancy/', '/role/', 'greenhouse.io', 'lever.co', 
-            'workday', 'ashbyhq.com'
-        ]
+        title_lower = title.lower()
         
-        if url and not any(pattern in url.lower() for pattern in job_url_patterns):
-            return False
+        # Must have Product Manager/PM in the title specifically, and no
+        # non-PM role even if it has "product" in the title
+        has_pm_in_title = False
+        for match in _TITLE_SCAN_RE.finditer(title_lower):
+            if match.lastgroup == 'exclude':
+                return False
+            has_pm_in_title = True
         
-        title_lower = title.lower()
+        return has_pm_in_title
+
+    def filter_pm_titles(self, titles: List[str]) -> List[int]:
+        """Return the indexes of titles that pass the PM title check, scanning them all at once"""
+        # Join the titles with NUL, which no title pattern can match across, so
+        # one finditer over the whole batch replaces a scan per title
+        blob = '\0'.join(titles)
+        if blob.isascii():
+            # ASCII lowercasing never changes a title's length, so the whole
+            # batch can be lowered in one call
+            blob = blob.lower()
+        else:
+            titles = [title.lower() for title in titles]
+            blob = '\0'.join(titles)
         
-        # Must have Product Manager/PM in the title specifically
-        # More flexible matching to catch variations
-        pm_patterns = [
-            'product manager', 'product management', 'pm,', '- pm', '(pm)', 
-            'senior pm', 'principal pm', 'staff pm', 'group pm',
-            'director of product', 'director, product', 'director product',
-            'head of product', 'vp product', 'vp of product', 'product lead',
-            'product owner', 'associate pm', 'junior pm', 'lead pm',
-            'product management', 'pm -', 'pm lead', 'pm director'
-        ]
+        starts = []
+        offset = 0
+        for title in titles:
+            starts.append(offset)
+            offset += len(title) + 1
         
-        has_pm_in_title = any(pattern in title_lower for pattern in pm_patterns)
-        
-        # Also check for "PM" as a standalone word (not part of another word)
-        import re
-        if not has_pm_in_title:
-            # Check for PM as a word boundary (e.g., "PM, ChatGPT" or "ChatGPT PM")
-            pm_word_pattern = r'\bpm\b'
-            if re.search(pm_word_pattern, title_lower):
-                has_pm_in_title = True
-        
-        # If it doesn't have PM in title, skip it
-        if not has_pm_in_title:
-            return False
-        
-        # Exclude non-PM roles even if they have "product" in title
-        # Be more specific with exclusions to avoid false negatives
-        exclude_patterns = [
-            'engineer', 'engineering manager', 'frontend', 'backend', 'developer',
-            'designer', 'design', 'marketing manager', 'sales', 'customer success',
-            'support', 'data analyst', 'intern', 'qa', 'test', 'devops', 
-            'data scientist', 'recruiter', 'account executive', 'content writer',
-            'researcher', 'research scientist', 'technical writer', 'program manager',
-            'project manager', 'operations manager', 'business development', 
-            'partnerships manager', 'growth marketing', 'strategist', 'evangelist'
-        ]
+        matched = set()
+        excluded = set()
+        for match in _TITLE_SCAN_RE.finditer(blob):
+            index = bisect_right(starts, match.start()) - 1
+            if match.lastgroup == 'exclude':
+                excluded.add(index)
+            else:
+                matched.add(index)
         
-        # Check if any exclude keywords are prominently in the title
-        for pattern in exclude_patterns:
-            if pattern in title_lower:
-                # Make exception for "Product Marketing Manager" which is sometimes grouped with PM
-                if pattern == 'marketing' and 'product marketing manager' in title_lower:
-                    continue
-                return False
+        return sorted(matched - excluded)
+
+    def select_job_elements(self, soup: BeautifulSoup, job_selectors: List[str]) -> Tuple[List, Optional[str]]:
+        """Find elements for the first selector (in priority order) that matches anything"""
+        # One traversal with the combined selector list, then attribute the
+        # hits to the highest-priority selector among them
+        candidates = soup.select(', '.join(job_selectors))
+        if candidates:
+            for selector in job_selectors:
+                elements = [element for element in candidates if element.css.match(selector)]
+                if elements:
+                    return elements, selector
         
-        return True
+        return [], None
 
-    def create_job_hash(self, job: Dict) -> str:
+    @staticmethod
+    def create_job_hash(job: Dict) -> str:
         """Create unique hash for job to detect duplicates"""
-        unique_string = f"{job['company']}{job['title']}{job['location']}"
-        return hashlib.md5(unique_string.encode()).hexdigest()[:12]
+        # NUL separators keep e.g. ("ab", "c") and ("a", "bc") apart; str() keeps
+        # a missing (None) field hashable, as it was when hashed via an f-string
+        digest = hashlib.blake2b(digest_size=JOB_HASH_SIZE)
+        digest.update(str(job['company']).encode())
+        digest.update(b'\0')
+        digest.update(str(job['title']).encode())
+        digest.update(b'\0')
+        digest.update(str(job['location']).encode())
+        return digest.hexdigest()
 
 
 class AshbyParser(BaseParser):
     """Parser for Ashby-powered job boards (OpenAI, etc.)"""
     
     def can_parse(self, url: str) -> bool:
-        return 'ashbyhq.com' in url
+        return _ASHBY_URL_RE.search(url) is not None
     
     def parse_jobs(self, company: str, url: str) -> List[Dict]:
         """Parse jobs from Ashby GraphQL API"""
         jobs = []
+        # Every job found in this run shares the same discovery date
+        today = datetime.now().strftime('%Y-%m-%d')
         
         try:
             # Extract organization name from URL
             # https://jobs.ashbyhq.com/openai/?departmentId=... -> openai
-            org_match = re.search(r'ashbyhq\.com/([^/?]+)', url)
+            org_match = _ASHBY_ORG_RE.search(url)
             if not org_match:
-                logger.error(f"Could not extract organization from URL: {url}")
+                logger.error("Could not extract organization from URL: %s", url)
                 return jobs
             
             org_name = org_match.group(1)
             
             # Make GraphQL request to Ashby API
-            api_url = "https://jobs.ashbyhq.com/api/non-user-graphql?op=ApiJobBoardWithTeams"
-            
-            query = """
-            query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
-              jobBoard: jobBoardWithTeams(
-                organizationHostedJobsPageName: $organizationHostedJobsPageName
-              ) {
-                teams {
-                  id
-                  name
-                  parentTeamId
-                  __typename
-                }
-                jobPostings {
-                  id
-                  title
-                  teamId
-                  locationId
-                  locationName
-                  workplaceType
-                  employmentType
-                  secondaryLocations {
-                    locationId
-                    locationName
-                    __typename
-                  }
-                  compensationTierSummary
-                  __typename
-                }
-                __typename
-              }
-            }
-            """
-            
             payload = {
                 "operationName": "ApiJobBoardWithTeams",
                 "variables": {"organizationHostedJobsPageName": org_name},
-                "query": query
-            }
-            
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'apollographql-client-name': 'frontend_non_user',
-                'apollographql-client-version': '0.1.0',
-                'Accept': '*/*',
-                'Origin': 'https://jobs.ashbyhq.com',
-                'Referer': url
+                "query": ASHBY_QUERY
             }
+            headers = {**ASHBY_HEADERS, 'Referer': url}
             
-            logger.info(f"Making GraphQL request to Ashby for {org_name}")
-            response = requests.post(api_url, json=payload, headers=headers, timeout=30)
+            logger.info("Making GraphQL request to Ashby for %s", org_name)
+            response = self.session.post(ASHBY_API_URL, json=payload, headers=headers, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = json.loads(response.content)
             
             if 'data' not in data or not data['data'].get('jobBoard'):
-                logger.error(f"No job board data found in response: {data}")
+                logger.error("No job board data found in response: %s", data)
                 return jobs
             
             job_board = data['data']['jobBoard']
@@ -212,7 +445,7 @@ class AshbyParser(BaseParser):
             # Create team lookup
             team_lookup = {team['id']: team['name'] for team in teams}
             
-            logger.info(f"Found {len(job_postings)} total jobs, {len(teams)} teams")
+            logger.info("Found %d total jobs, %d teams", len(job_postings), len(teams))
             
             # Define Product Management team IDs for different companies
             pm_team_ids = {
@@ -220,54 +453,50 @@ class AshbyParser(BaseParser):
                 # Add other companies' PM team IDs as needed
             }
             
-            # Filter for Product Manager jobs
-            for job in job_postings:
+            # Filter for Product Manager jobs - strict title matching only,
+            # checked for every posting in one batch
+            pm_indexes = self.filter_pm_titles([job.get('title', '') for job in job_postings])
+            
+            for index in pm_indexes:
+                job = job_postings[index]
                 title = job.get('title', '')
                 team_id = job.get('teamId', '')
-                team_name = team_lookup.get(team_id, '').lower()
                 
-                # Check if it's a Product Manager role - strict title matching only
-                is_pm_by_title = self.is_product_management_job(title, "", "")
+                # Build location string
+                location = job.get('locationName', 'Unknown')
+                secondary_locations = job.get('secondaryLocations', [])
+                if secondary_locations:
+                    additional_locs = [loc.get('locationName', '') for loc in secondary_locations 
+                                     if loc.get('locationName')]
+                    if additional_locs:
+                        location += f" (+ {', '.join(additional_locs)})"
                 
-                # Skip jobs that don't have Product Manager in the title
-                if is_pm_by_title:
-                    
-                    # Build location string
-                    location = job.get('locationName', 'Unknown')
-                    secondary_locations = job.get('secondaryLocations', [])
-                    if secondary_locations:
-                        additional_locs = [loc.get('locationName', '') for loc in secondary_locations 
-                                         if loc.get('locationName')]
-                        if additional_locs:
-                            location += f" (+ {', '.join(additional_locs)})"
-                    
-                    # Add workplace type
-                    workplace_type = job.get('workplaceType')
-                    if workplace_type and workplace_type not in ['null', None, '']:
-                        location += f" - {workplace_type}"
-                    
-                    # Construct job URL
-                    job_url = f"https://jobs.ashbyhq.com/{org_name}/{job.get('id', '')}"
-                    
-                    job_data = {
-                        'company': company,
-                        'title': title,
-                        'location': location,
-                        'url': job_url,
-                        'date_posted': 'Unknown',  # Ashby doesn't expose posting dates in this API
-                        'date_found': datetime.now().strftime('%Y-%m-%d'),
-                        'status': 'active'
-                    }
-                    job_data['hash'] = self.create_job_hash(job_data)
-                    
-                    jobs.append(job_data)
-                    team_info = team_lookup.get(team_id, 'Unknown team')
-                    logger.info(f"✅ Found PM job: {title} ({team_info})")
+                # Add workplace type
+                workplace_type = job.get('workplaceType')
+                if workplace_type and workplace_type not in ['null', None, '']:
+                    location += f" - {workplace_type}"
+                
+                # Construct job URL
+                job_url = f"https://jobs.ashbyhq.com/{org_name}/{job.get('id', '')}"
+                
+                job_data = {
+                    'company': company,
+                    'title': title,
+                    'location': location,
+                    'url': job_url,
+                    'date_posted': 'Unknown',  # Ashby doesn't expose posting dates in this API
+                    'date_found': today,
+                    'status': 'active'
+                }
+                job_data['hash'] = self.create_job_hash(job_data)
+                
+                jobs.append(job_data)
+                logger.debug("✅ Found PM job: %s (%s)", title, team_lookup.get(team_id, 'Unknown team'))
             
-            logger.info(f"📊 Total PM jobs found at {company}: {len(jobs)}")
+            logger.info("📊 Total PM jobs found at %s: %d", company, len(jobs))
             
         except Exception as e:
-            logger.error(f"❌ Error parsing Ashby jobs from {company}: {str(e)}")
+            logger.error("❌ Error parsing Ashby jobs from %s: %s", company, e)
             import traceback
             logger.error(traceback.format_exc())
         
@@ -278,22 +507,122 @@ class GreenhouseParser(BaseParser):
     """Parser for Greenhouse-powered job boards (Anthropic, etc.)"""
     
     def can_parse(self, url: str) -> bool:
-        return 'greenhouse.io' in url
+        return _GREENHOUSE_URL_RE.search(url) is not None
+    
+    def find_card_elements(self, element) -> Tuple:
+        """Find a job card's title, location and link elements in a single pass over its descendants"""
+        title_elem = location_elem = link_elem = None
+        for tag in element.descendants:
+            if tag.name is None:  # text node
+                continue
+            if title_elem is None and tag.name in ('h3', 'h4', 'a'):
+                title_elem = tag
+            if location_elem is None and _has_location_class(tag):
+                location_elem = tag
+            if link_elem is None and tag.name == 'a' and tag.has_attr('href'):
+                link_elem = tag
+            if title_elem is not None and location_elem is not None and link_elem is not None:
+                break
+        return title_elem, location_elem, link_elem
+    
+    def fetch_api_postings(self, url: str) -> Optional[List[Dict]]:
+        """Fetch a board's postings from the Greenhouse JSON API, or None if the board has none"""
+        board_match = _GREENHOUSE_BOARD_RE.search(url)
+        if not board_match:
+            return None
+        
+        board_api_url = f"{GREENHOUSE_API_URL}/{board_match.group(1)}"
+        department_ids = parse_qs(urlparse(url).query).get('departments[]', [])
+        
+        # The board's department filter also lists jobs in child departments, so
+        # widen the requested departments to everything beneath them
+        wanted_department_ids = None
+        if department_ids:
+            response = self.session.get(f"{board_api_url}/departments", timeout=30)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            child_ids = {
+                str(department['id']): [str(child_id) for child_id in department.get('child_ids') or ()]
+                for department in json.loads(response.content).get('departments', [])
+            }
+            wanted_department_ids = set()
+            pending = list(department_ids)
+            while pending:
+                department_id = pending.pop()
+                if department_id not in wanted_department_ids:
+                    wanted_department_ids.add(department_id)
+                    pending.extend(child_ids.get(department_id, ()))
+        
+        # Jobs only list their departments when fetched with content=true
+        params = {'content': 'true'} if wanted_department_ids is not None else None
+        response = self.session.get(f"{board_api_url}/jobs", params=params, timeout=30)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        postings = json.loads(response.content).get('jobs', [])
+        
+        if wanted_department_ids is not None:
+            postings = [
+                posting for posting in postings
+                if any(str(department.get('id')) in wanted_department_ids
+                       for department in posting.get('departments') or ())
+            ]
+        
+        return postings
+    
+    def parse_api_postings(self, company: str, url: str, postings: List[Dict], today: str) -> List[Dict]:
+        """Build PM job records straight from Greenhouse API postings"""
+        jobs = []
+        
+        for index in self.filter_pm_titles([posting.get('title', '') for posting in postings]):
+            posting = postings[index]
+            title = posting.get('title', '')
+            location = (posting.get('location') or {}).get('name') or "Unknown"
+            
+            # first_published is an ISO timestamp; keep just the date
+            first_published = posting.get('first_published')
+            
+            job_data = {
+                'company': company,
+                'title': title,
+                'location': location,
+                'url': posting.get('absolute_url') or url,
+                'date_posted': first_published[:10] if first_published else 'Unknown',
+                'date_found': today,
+                'status': 'active',
+                # absolute_url may point at the company's own site (?gh_jid=...),
+                # so the posting id is kept for matching the job across runs
+                'greenhouse_id': str(posting['id'])
+            }
+            job_data['hash'] = self.create_job_hash(job_data)
+            
+            jobs.append(job_data)
+            logger.debug("✅ Found Greenhouse PM job: %s", title)
+        
+        return jobs
     
     def parse_jobs(self, company: str, url: str) -> List[Dict]:
         """Parse jobs from Greenhouse job boards"""
         jobs = []
+        # Every job found in this run shares the same discovery date
+        today = datetime.now().strftime('%Y-%m-%d')
         
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            # Prefer the board's JSON API, which skips HTML parsing entirely;
+            # boards without one fall back to scraping the page
+            postings = self.fetch_api_postings(url)
+            if postings is not None:
+                logger.info("Fetched %d jobs from the Greenhouse API for %s", len(postings), company)
+                jobs = self.parse_api_postings(company, url, postings, today)
+                logger.info("📊 Total PM jobs found at %s: %d", company, len(jobs))
+                return jobs
             
-            logger.info(f"Fetching Greenhouse board: {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            logger.info("Fetching Greenhouse board: %s", url)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_BODY_ONLY)
             
             # Greenhouse-specific selectors
             job_selectors = [
@@ -301,43 +630,39 @@ class GreenhouseParser(BaseParser):
                 '.job-listing', '.career-listing', '.opening-item'
             ]
             
-            job_elements = []
-            for selector in job_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    job_elements = elements
-                    logger.info(f"Found {len(elements)} jobs using selector: {selector}")
-                    break
+            job_elements, selector = self.select_job_elements(soup, job_selectors)
+            if job_elements:
+                logger.info("Found %d jobs using selector: %s", len(job_elements), selector)
             
             # If no elements found, try link approach
             if not job_elements:
                 all_links = soup.find_all('a', href=True)
                 for link in all_links:
-                    text = link.get_text().lower()
-                    if any(word in text for word in ['manager', 'product', 'director']):
+                    if _GREENHOUSE_LINK_TEXT_RE.search(link.get_text().lower()):
                         job_elements.append(link)
-                logger.info(f"Found {len(job_elements)} potential job links")
+                logger.info("Found %d potential job links", len(job_elements))
             
             for element in job_elements:
                 try:
+                    # Title, location and link elements all come from one walk of the card
+                    title_elem, location_elem, link_elem = self.find_card_elements(element)
+                    
                     # Extract title
-                    title_elem = element.find(['h3', 'h4', 'a']) or element
-                    title = title_elem.get_text(strip=True)
+                    title = (title_elem or element).get_text(strip=True)
                     
                     if not self.is_product_management_job(title):
                         continue
                     
                     # Extract location
-                    location_elem = element.find(class_=re.compile(r'location', re.I))
                     location = location_elem.get_text(strip=True) if location_elem else "Unknown"
                     
                     # Extract URL
-                    link_elem = element.find('a', href=True) if element.name != 'a' else element
+                    if element.name == 'a':
+                        link_elem = element
                     job_url = ""
                     if link_elem and link_elem.get('href'):
                         job_url = link_elem.get('href')
                         if not job_url.startswith('http'):
-                            from urllib.parse import urljoin
                             job_url = urljoin(url, job_url)
                     
                     job_data = {
@@ -346,20 +671,22 @@ class GreenhouseParser(BaseParser):
                         'location': location,
                         'url': job_url or url,
                         'date_posted': 'Unknown',
-                        'date_found': datetime.now().strftime('%Y-%m-%d'),
+                        'date_found': today,
                         'status': 'active'
                     }
                     job_data['hash'] = self.create_job_hash(job_data)
                     
                     jobs.append(job_data)
-                    logger.info(f"✅ Found Greenhouse PM job: {title}")
+                    logger.debug("✅ Found Greenhouse PM job: %s", title)
                     
                 except Exception as e:
-                    logger.debug(f"Error parsing Greenhouse job element: {e}")
+                    logger.debug("Error parsing Greenhouse job element: %s", e)
                     continue
             
+            logger.info("📊 Total PM jobs found at %s: %d", company, len(jobs))
+            
         except Exception as e:
-            logger.error(f"❌ Error parsing Greenhouse jobs from {company}: {e}")
+            logger.error("❌ Error parsing Greenhouse jobs from %s: %s", company, e)
         
         return jobs
 
@@ -371,13 +698,36 @@ class GenericParser(BaseParser):
         # Default parser - can handle any URL
         return True
     
-    def parse_date_text(self, date_text: str) -> str:
-        """Parse various date formats into standardized format"""
+    def find_card_elements(self, element) -> Tuple:
+        """Find a job card's heading, title-class, first link, location and href link
+        elements in a single pass over its descendants"""
+        heading_elem = title_class_elem = first_link_elem = location_elem = link_elem = None
+        for tag in element.descendants:
+            if tag.name is None:  # text node
+                continue
+            if heading_elem is None and tag.name in ('h1', 'h2', 'h3', 'h4'):
+                heading_elem = tag
+            if title_class_elem is None and _has_class_matching(tag, _TITLE_CLASS_RE):
+                title_class_elem = tag
+            if first_link_elem is None and tag.name == 'a':
+                first_link_elem = tag
+            if location_elem is None and _has_class_matching(tag, _CARD_LOCATION_CLASS_RE):
+                location_elem = tag
+            if link_elem is None and tag.name == 'a' and tag.has_attr('href'):
+                link_elem = tag
+            if (heading_elem is not None and title_class_elem is not None and first_link_elem is not None
+                    and location_elem is not None and link_elem is not None):
+                break
+        return heading_elem, title_class_elem, first_link_elem, location_elem, link_elem
+    
+    def parse_date_text(self, date_text: str, today: Optional[datetime] = None) -> str:
+        """Parse various date formats into standardized format, relative to `today`"""
         if not date_text:
             return None
             
         date_text = date_text.lower().strip()
-        today = datetime.now()
+        if today is None:
+            today = datetime.now()
         
         # Handle relative dates
         if 'today' in date_text or '0 days ago' in date_text:
@@ -386,22 +736,14 @@ class GenericParser(BaseParser):
             return (today - timedelta(days=1)).strftime('%Y-%m-%d')
         
         # Handle "X days/weeks/months ago"
-        time_ago_match = re.search(r'(\d+)\s+(day|week|month)s?\s+ago', date_text)
+        time_ago_match = _TIME_AGO_RE.search(date_text)
         if time_ago_match:
             number = int(time_ago_match.group(1))
-            unit = time_ago_match.group(2)
-            
-            if unit == 'day':
-                date = today - timedelta(days=number)
-            elif unit == 'week':
-                date = today - timedelta(weeks=number)
-            elif unit == 'month':
-                date = today - timedelta(days=number * 30)  # Approximate
-            
+            date = today - number * _TIME_AGO_UNITS[time_ago_match.group(2)]
             return date.strftime('%Y-%m-%d')
         
         # Handle absolute dates (basic parsing)
-        date_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})', date_text)
+        date_match = _DATE_SLASH_RE.search(date_text)
         if date_match:
             month, day, year = date_match.groups()
             if len(year) == 2:
@@ -414,22 +756,15 @@ class GenericParser(BaseParser):
         
         return None
 
-    def extract_date_posted(self, element) -> str:
-        """Try to extract when the job was posted"""
-        element_text = element.get_text()
-        
-        # Common date patterns
-        date_patterns = [
-            r'(\d{1,2})\s+(days?|weeks?|months?)\s+ago',
-            r'(yesterday|today)',
-            r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},?\s+\d{2,4}'
-        ]
+    def extract_date_posted(self, element_text: str, today: Optional[datetime] = None) -> str:
+        """Try to extract when the job was posted from a job card's text"""
+        if not _DATE_HINT_RE.search(element_text):
+            return "Unknown"
         
-        for pattern in date_patterns:
-            match = re.search(pattern, element_text, re.I)
+        for pattern in _DATE_POSTED_RES:
+            match = pattern.search(element_text)
             if match:
-                parsed_date = self.parse_date_text(match.group(0))
+                parsed_date = self.parse_date_text(match.group(0), today)
                 if parsed_date:
                     return parsed_date
         
@@ -438,18 +773,18 @@ class GenericParser(BaseParser):
     def parse_jobs(self, company: str, url: str) -> List[Dict]:
         """Parse jobs using BeautifulSoup (original logic)"""
         jobs = []
+        # Every job found in this run shares the same discovery date, and
+        # relative posting dates are resolved against the same moment
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
         
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            logger.info(f"Fetching {url}")
-            response = requests.get(url, headers=headers, timeout=30)
+            logger.info("Fetching %s", url)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            logger.info(f"Got response: {response.status_code}, Content length: {len(response.text)} chars")
+            logger.info("Got response: %s, Content length: %d bytes", response.status_code, len(response.content))
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_BODY_ONLY)
             
             # Common selectors for job listings
             job_selectors = [
@@ -468,40 +803,25 @@ class GenericParser(BaseParser):
                 'a[data-analytics-category="Links"]'  # Stripe analytics
             ]
             
-            job_elements = []
-            for selector in job_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    job_elements = elements
-                    logger.info(f"Found {len(elements)} job elements using selector: {selector}")
-                    break
+            job_elements, selector = self.select_job_elements(soup, job_selectors)
+            if job_elements:
+                logger.info("Found %d job elements using selector: %s", len(job_elements), selector)
             
             # If no structured job elements found, look for links with job-related text
             if not job_elements:
                 logger.info("No structured elements found, trying link-based approach")
-                all_links = soup.find_all('a', href=True)
-                logger.info(f"Found {len(all_links)} total links on page")
-                job_elements = []
-                
-                for link in all_links:
-                    href = link.get('href', '')
-                    text = link.get_text().lower()
-                    aria_label = link.get('aria-label', '').lower()
-                    
-                    # Check if it's a job listing URL or has job-related text
-                    is_job_url = any(pattern in href for pattern in ['/jobs/listing/', '/careers/', '/job/', '/opening/', 'jobs/results/'])
-                    has_job_text = any(word in text for word in ['manager', 'product', 'director', 'lead', 'senior', 'principal', 'staff'])
-                    has_job_aria = any(word in aria_label for word in ['manager', 'product', 'director', 'lead', 'senior'])
-                    
-                    if is_job_url or has_job_text or has_job_aria:
-                        job_elements.append(link)
-                
-                logger.info(f"Found {len(job_elements)} potential job links")
+                # Links with a job-like URL or text; only as many as get parsed
+                # are collected, so the search stops early on link-heavy pages
+                job_elements = soup.find_all(_is_candidate_job_link, limit=MAX_JOB_ELEMENTS)
+                logger.info("Found %d potential job links", len(job_elements))
             
             # Parse job elements
             parsed_count = 0
-            for element in job_elements[:50]:  # Limit to prevent overload
+            for element in job_elements[:MAX_JOB_ELEMENTS]:
                 try:
+                    (heading_elem, title_class_elem, first_link_elem,
+                     location_elem, link_elem) = self.find_card_elements(element)
+                    
                     # Extract job title
                     title = ""
                     
@@ -523,105 +843,95 @@ class GenericParser(BaseParser):
                         href = element.get('href', '')
                         if 'jobs/results/' in href:
                             # Extract from URL: /jobs/results/ID-job-title-slug
-                            match = re.search(r'jobs/results/\d+-(.+?)(?:\?|$)', href)
+                            match = _GOOGLE_JOB_SLUG_RE.search(href)
                             if match:
                                 # Convert slug to title: senior-product-manager -> Senior Product Manager
                                 title = match.group(1).replace('-', ' ').title()
                     
                     # If still not found, try other methods
                     if not title or len(title) < 5:
-                        title_elem = (
-                            element.find(['h1', 'h2', 'h3', 'h4']) or 
-                            element.find(class_=re.compile(r'title|job-title|position|role-title|QJPWVe', re.I)) or
-                            element.find('a') or
-                            element
-                        )
+                        title_elem = heading_elem or title_class_elem or first_link_elem or element
                         title = title_elem.get_text(strip=True) if title_elem else "Unknown"
                     
                     # Clean up title
-                    title = re.sub(r'\s+', ' ', title)  # Remove extra whitespace
-                    title = title.split('\n')[0].strip()  # Take first line only
+                    title = ' '.join(title.split())  # Collapse whitespace, newlines included
                     
                     # Skip if title is too generic, empty, or not relevant
                     if (len(title) < 5 or 
                         title.lower() in ['jobs', 'careers', 'apply', 'view all', 'see all', 'more'] or
                         len(title) > 200):
-                        logger.debug(f"Skipping generic title: '{title}'")
+                        logger.debug("Skipping generic title: '%s'", title)
                         continue
                     
-                    # Extract location
-                    location_patterns = [
-                        r'([A-Za-z\s]+,\s*[A-Z]{2,})',  # City, State/Country
-                        r'(Remote)',
-                        r'([A-Za-z\s]+,\s*[A-Z]{2})',  # City, ST
-                        r'(New York|San Francisco|London|Berlin|Toronto|Seattle|Boston|Austin)'
-                    ]
+                    # Extract job URL
+                    job_url = ""
+                    if element.name == 'a' and element.get('href'):
+                        job_url = element.get('href')
+                    elif link_elem:
+                        job_url = link_elem.get('href')
                     
-                    location = "Remote/Unknown"
-                    location_elem = element.find(class_=re.compile(r'location|city|office|geo', re.I))
+                    if job_url and not job_url.startswith('http'):
+                        job_url = urljoin(url, job_url)
+                    
+                    # Check if it's a Product Management role before extracting anything else
+                    if not self.is_product_management_job(title, job_url):
+                        continue
+                    
+                    # The card's full text, collected once for the location
+                    # fallback and the posting date
+                    element_text = element.get_text()
                     
+                    # Extract location
+                    location = "Remote/Unknown"
                     if location_elem:
                         location_text = location_elem.get_text(strip=True)
                     else:
-                        location_text = element.get_text()
+                        location_text = element_text
                     
-                    for pattern in location_patterns:
-                        match = re.search(pattern, location_text, re.I)
+                    for pattern in _LOCATION_RES:
+                        match = pattern.search(location_text)
                         if match:
                             location = match.group(1).strip()
                             break
                     
-                    # Extract job URL
-                    job_url = ""
-                    if element.name == 'a' and element.get('href'):
-                        job_url = element.get('href')
-                    else:
-                        link_elem = element.find('a', href=True)
-                        if link_elem:
-                            job_url = link_elem.get('href')
-                    
-                    if job_url and not job_url.startswith('http'):
-                        from urllib.parse import urljoin
-                        job_url = urljoin(url, job_url)
-                    
-                    # Extract description (for filtering only)
-                    desc_elem = element.find(class_=re.compile(r'description|summary|excerpt|snippet', re.I))
-                    description = ""
-                    if desc_elem:
-                        description = desc_elem.get_text(strip=True)[:300]
-                    
                     # Extract date posted
-                    date_posted = self.extract_date_posted(element)
+                    date_posted = self.extract_date_posted(element_text, now)
                     
-                    # Check if it's a Product Management role
-                    if self.is_product_management_job(title, job_url, description):
-                        job_data = {
-                            'company': company,
-                            'title': title,
-                            'location': location,
-                            'url': job_url or url,
-                            'date_posted': date_posted,
-                            'date_found': datetime.now().strftime('%Y-%m-%d'),
-                            'status': 'active'
-                        }
-                        job_data['hash'] = self.create_job_hash(job_data)
-                        
-                        jobs.append(job_data)
-                        parsed_count += 1
-                        logger.info(f"✅ Found PM job: {title} at {location}")
+                    job_data = {
+                        'company': company,
+                        'title': title,
+                        'location': location,
+                        'url': job_url or url,
+                        'date_posted': date_posted,
+                        'date_found': today,
+                        'status': 'active'
+                    }
+                    job_data['hash'] = self.create_job_hash(job_data)
+                    
+                    jobs.append(job_data)
+                    parsed_count += 1
+                    logger.debug("✅ Found PM job: %s at %s", title, location)
                         
                 except Exception as e:
-                    logger.debug(f"Error parsing job element: {e}")
+                    logger.debug("Error parsing job element: %s", e)
                     continue
             
-            logger.info(f"Successfully parsed {parsed_count} PM jobs from {len(job_elements)} elements")
+            logger.info("Successfully parsed %d PM jobs from %d elements", parsed_count, len(job_elements))
                     
         except Exception as e:
-            logger.error(f"❌ Error parsing generic jobs from {company}: {e}")
+            logger.error("❌ Error parsing generic jobs from %s: %s", company, e)
             
         return jobs
 
 
+def write_file_atomically(path: Path, content: str):
+    """Write a file via a temporary sibling and rename, so readers never see it half-written"""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
 class JobScraper:
     def __init__(self, data_dir: str = "data"):
         """Initialize the job scraper with local file storage"""
@@ -633,11 +943,15 @@ class JobScraper:
         self.jobs_json = self.data_dir / "jobs.json"
         self.stats_json = self.data_dir / "stats.json"
         
+        # One pooled session shared by every parser, so requests to the same
+        # host reuse an open connection instead of a new TCP+TLS handshake
+        self.session = create_session()
+        
         # Initialize parsers (order matters - most specific first)
         self.parsers = [
-            AshbyParser(),
-            GreenhouseParser(),
-            GenericParser()  # Always last as fallback
+            AshbyParser(self.session),
+            GreenhouseParser(self.session),
+            GenericParser(self.session)  # Always last as fallback
         ]
         
         self.initialize_files()
@@ -646,7 +960,7 @@ class JobScraper:
         """Get the appropriate parser for a given URL"""
         for parser in self.parsers:
             if parser.can_parse(url):
-                logger.info(f"Using {parser.__class__.__name__} for {url}")
+                logger.info("Using %s for %s", parser.__class__.__name__, url)
                 return parser
         
         # Should never reach here due to GenericParser fallback
@@ -657,15 +971,29 @@ class JobScraper:
         parser = self.get_parser_for_url(url)
         return parser.parse_jobs(company, url)
     
+    def scrape_host_companies(self, host_companies: List[Tuple[str, str]]) -> List[Tuple[str, List[Dict]]]:
+        """Scrape companies that share a host one after another"""
+        results = []
+        
+        # The session spaces out requests to each host, so no pause is needed here
+        for company, url in host_companies:
+            logger.info("🔍 Scraping %s...", company)
+            try:
+                jobs = self.scrape_company_jobs(company, url)
+            except Exception as e:
+                logger.error("❌ Failed to scrape %s: %s", company, e)
+                jobs = []
+            
+            results.append((company, jobs))
+        
+        return results
+    
     def initialize_files(self):
         """Create initial data files if they don't exist"""
         if not self.jobs_csv.exists():
             with open(self.jobs_csv, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    'company', 'title', 'location', 'url', 'date_posted', 
-                    'date_found', 'hash', 'status'
-                ])
+                writer.writerow(JOB_FIELDS)
                 
         if not self.jobs_json.exists():
             with open(self.jobs_json, 'w') as f:
@@ -680,62 +1008,86 @@ class JobScraper:
                     'run_history': []
                 }, f)
     
-    def load_existing_jobs(self) -> Dict[str, Dict]:
+    def load_existing_jobs(self) -> List[Dict]:
         """Load existing jobs from JSON file"""
         try:
             with open(self.jobs_json, 'r') as f:
-                jobs_list = json.load(f)
-                return {job['hash']: job for job in jobs_list}
+                return json.load(f)
         except Exception as e:
-            logger.error(f"Error loading existing jobs: {e}")
-            return {}
+            logger.error("Error loading existing jobs: %s", e)
+            return []
+    
+    def migrate_legacy_hashes(self, jobs: List[Dict]) -> int:
+        """Re-key jobs saved under an older hashing scheme, returning how many changed"""
+        migrated = 0
+        for job in jobs:
+            if len(job.get('hash') or '') != 2 * JOB_HASH_SIZE:
+                job['hash'] = BaseParser.create_job_hash(job)
+                migrated += 1
+        return migrated
     
-    def save_jobs(self, all_jobs: List[Dict]):
-        """Save jobs to both CSV and JSON files"""
+    def save_jobs(self, all_jobs: List[Dict], new_jobs: List[Dict], rewrite_csv: bool = False):
+        """Save all jobs to JSON and add the new ones to CSV (rebuilding it if `rewrite_csv`)"""
         try:
-            # Save to JSON (complete data)
-            with open(self.jobs_json, 'w') as f:
-                json.dump(all_jobs, f, indent=2)
-            logger.info(f"✅ Saved {len(all_jobs)} jobs to JSON")
+            # One job per line: without indent, json.dumps runs on the C
+            # encoder, and the file stays valid JSON with per-job diffs
+            json_content = '[\n' + ',\n'.join(map(json.dumps, all_jobs)) + '\n]\n'
             
-            # Save to CSV (for easy viewing)
-            with open(self.jobs_csv, 'w', newline='', encoding='utf-8') as f:
-                if all_jobs:
-                    writer = csv.DictWriter(f, fieldnames=all_jobs[0].keys())
-                    writer.writeheader()
-                    writer.writerows(all_jobs)
-                    logger.info(f"✅ Saved {len(all_jobs)} jobs to CSV")
+            # Save to JSON (complete data), replacing the old file atomically,
+            # unless it already holds exactly this content
+            if self.jobs_json.exists() and self.jobs_json.read_text() == json_content:
+                logger.info("✅ JSON already up to date with %d jobs", len(all_jobs))
+            else:
+                write_file_atomically(self.jobs_json, json_content)
+                logger.info("✅ Saved %d jobs to JSON", len(all_jobs))
+            
+            if rewrite_csv:
+                # Stored jobs changed (e.g. re-keyed hashes), so rebuild the CSV from scratch
+                with open(self.jobs_csv, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(JOB_FIELDS)
+                    writer.writerows(map(itemgetter(*JOB_FIELDS), all_jobs))
+                logger.info("✅ Rewrote CSV with %d jobs", len(all_jobs))
+            else:
+                # Append to CSV (for easy viewing); existing rows never change
+                with open(self.jobs_csv, 'a', newline='', encoding='utf-8') as f:
+                    csv.writer(f).writerows(map(itemgetter(*JOB_FIELDS), new_jobs))
+                logger.info("✅ Appended %d new jobs to CSV", len(new_jobs))
             
         except Exception as e:
-            logger.error(f"❌ Error saving jobs: {e}")
+            logger.error("❌ Error saving jobs: %s", e)
     
-    def update_stats(self, companies: Dict[str, str], new_jobs_count: int):
-        """Update statistics file"""
+    def update_stats(self, companies: Dict[str, str], new_jobs_count: int, total_jobs_count: int) -> Optional[Dict]:
+        """Update statistics file, returning the stats written (None if that failed)"""
         try:
             with open(self.stats_json, 'r') as f:
                 stats = json.load(f)
             
+            # The run is stamped with one time everywhere it is recorded
+            run_time = datetime.now().strftime('%Y-%m-%d %H:%M')
+            
             # Update stats
-            stats['total_jobs_found'] = len(self.load_existing_jobs())
-            stats['last_run'] = datetime.now().strftime('%Y-%m-%d %H:%M')
-            stats['companies_scraped'] = {company: url for company, url in companies.items()}
+            stats['total_jobs_found'] = total_jobs_count
+            stats['last_run'] = run_time
+            stats['companies_scraped'] = dict(companies)
             
             # Add to run history
             run_info = {
-                'date': datetime.now().strftime('%Y-%m-%d %H:%M'),
+                'date': run_time,
                 'new_jobs': new_jobs_count,
                 'companies_scraped': len(companies)
             }
-            stats['run_history'].append(run_info)
-            
-            # Keep only last 30 runs
-            stats['run_history'] = stats['run_history'][-30:]
+            # Keep only last 30 runs; the bounded deque drops the oldest on append
+            run_history = deque(stats['run_history'], maxlen=30)
+            run_history.append(run_info)
+            stats['run_history'] = list(run_history)
             
-            with open(self.stats_json, 'w') as f:
-                json.dump(stats, f, indent=2)
+            write_file_atomically(self.stats_json, json.dumps(stats, indent=2))
+            return stats
                 
         except Exception as e:
-            logger.error(f"Error updating stats: {e}")
+            logger.error("Error updating stats: %s", e)
+            return None
     
     def run_scraper(self, companies: Dict[str, str]):
         """Main scraper function"""
@@ -743,103 +1095,140 @@ class JobScraper:
         
         # Load existing jobs
         existing_jobs = self.load_existing_jobs()
-        logger.info(f"Loaded {len(existing_jobs)} existing jobs")
+        logger.info("Loaded %d existing jobs", len(existing_jobs))
+        
+        # Jobs saved under an older hashing scheme are re-keyed once; saving
+        # them back, CSV included, completes the migration
+        migrated_count = self.migrate_legacy_hashes(existing_jobs)
+        if migrated_count:
+            logger.info("Re-keyed %d jobs saved under an older hash scheme", migrated_count)
+        
+        # Hashes already tracked, including new jobs accepted during this run
+        seen_hashes = {job['hash'] for job in existing_jobs}
+        
+        # Greenhouse jobs are matched on posting id: boards scraped from HTML stored
+        # titles with the location (and badges like "New") glued on, so the API's
+        # clean postings hash differently and would otherwise come back as new
+        greenhouse_jobs = {}
+        for job in existing_jobs:
+            posting_id = _greenhouse_posting_id(job)
+            if posting_id is not None:
+                greenhouse_jobs.setdefault(posting_id, []).append(job)
         
         new_jobs = []
+        stale_jobs = []
+        refreshed_count = 0
         
+        # Different hosts are scraped concurrently; companies on the same host
+        # share a worker, since the session would only make them wait on each other
+        companies_by_host = {}
         for company, url in companies.items():
-            logger.info(f"🔍 Scraping {company}...")
-            try:
-                jobs = self.scrape_company_jobs(company, url)
-                
-                # Filter out existing jobs
-                truly_new = [job for job in jobs if job['hash'] not in existing_jobs]
-                new_jobs.extend(truly_new)
-                
-                logger.info(f"✅ {company}: {len(jobs)} PM jobs found, {len(truly_new)} new")
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to scrape {company}: {e}")
-            
-            # Be respectful with delays
-            time.sleep(3)
+            companies_by_host.setdefault(urlparse(url).netloc, []).append((company, url))
         
-        # Combine existing and new jobs
-        all_jobs_dict = existing_jobs.copy()
-        for job in new_jobs:
-            all_jobs_dict[job['hash']] = job
+        with ThreadPoolExecutor(max_workers=MAX_SCRAPE_WORKERS) as executor:
+            futures = [
+                executor.submit(self.scrape_host_companies, host_companies)
+                for host_companies in companies_by_host.values()
+            ]
+            
+            for future in futures:
+                for company, jobs in future.result():
+                    # Filter out existing jobs
+                    truly_new = []
+                    for job in jobs:
+                        # A known Greenhouse posting refreshes its earliest record in
+                        # place, keeping the date it was first found, and any other
+                        # stored copies of it are dropped
+                        posting_id = _greenhouse_posting_id(job)
+                        known_jobs = greenhouse_jobs.get(posting_id) if posting_id is not None else None
+                        if known_jobs:
+                            kept_job = min(known_jobs, key=itemgetter('date_found'))
+                            refreshed_job = {**kept_job, **job, 'date_found': kept_job['date_found']}
+                            if refreshed_job != kept_job or len(known_jobs) > 1:
+                                kept_job.update(refreshed_job)
+                                stale_jobs.extend(known_job for known_job in known_jobs if known_job is not kept_job)
+                                known_jobs[:] = [kept_job]
+                                refreshed_count += 1
+                            seen_hashes.add(job['hash'])
+                            continue
+                        
+                        if job['hash'] not in seen_hashes:
+                            seen_hashes.add(job['hash'])
+                            truly_new.append(job)
+                    new_jobs.extend(truly_new)
+                    
+                    logger.info("✅ %s: %d PM jobs found, %d new", company, len(jobs), len(truly_new))
         
-        all_jobs = list(all_jobs_dict.values())
+        # Combine existing and new jobs, minus superseded Greenhouse copies
+        if stale_jobs:
+            stale_ids = {id(job) for job in stale_jobs}
+            existing_jobs = [job for job in existing_jobs if id(job) not in stale_ids]
+        all_jobs = existing_jobs + new_jobs
         
         # Sort by date found (newest first)
-        all_jobs.sort(key=lambda x: x['date_found'], reverse=True)
+        all_jobs.sort(key=itemgetter('date_found'), reverse=True)
         
         # Save all jobs
-        self.save_jobs(all_jobs)
+        if refreshed_count:
+            logger.info("Refreshed %d known Greenhouse postings in place", refreshed_count)
+        self.save_jobs(all_jobs, new_jobs, rewrite_csv=migrated_count > 0 or refreshed_count > 0)
         
         # Update statistics
-        self.update_stats(companies, len(new_jobs))
+        stats = self.update_stats(companies, len(new_jobs), len(all_jobs))
         
-        # Create HTML report
-        create_html_report(self.data_dir)
+        # Create HTML report from the data already in memory
+        create_html_report(self.data_dir, all_jobs, stats)
         
-        logger.info(f"🎉 Scraper completed! Found {len(new_jobs)} new jobs out of {len(all_jobs)} total")
+        logger.info("🎉 Scraper completed! Found %d new jobs out of %d total", len(new_jobs), len(all_jobs))
         
         return len(new_jobs), len(all_jobs)
 
 
-def create_html_report(data_dir: Path):
-    """Create a simple HTML report"""
-    try:
-        with open(data_dir / "jobs.json", 'r') as f:
-            jobs = json.load(f)
-        
-        with open(data_dir / "stats.json", 'r') as f:
-            stats = json.load(f)
-        
-        html_content = f"""
+# Static shell of the dashboard page, compiled once. The footer holds JS
+# template literals (${...}), so it is a plain string rather than a Template
+DASHBOARD_HEADER_TEMPLATE = string.Template("""
 <!DOCTYPE html>
 <html>
 <head>
     <title>Job Search Dashboard</title>
     <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background: #f0f8ff; padding: 20px; border-radius: 8px; margin-bottom: 20px; }}
-        .stats {{ display: flex; gap: 20px; margin-bottom: 20px; }}
-        .stat-box {{ background: #fff; border: 1px solid #ddd; padding: 15px; border-radius: 8px; flex: 1; }}
-        .filters {{ background: #f9f9f9; padding: 15px; border-radius: 8px; margin-bottom: 20px; }}
-        .filter-group {{ display: flex; align-items: center; gap: 10px; margin-bottom: 10px; }}
-        select {{ padding: 8px 12px; border: 1px solid #ddd; border-radius: 4px; font-size: 14px; }}
-        .job-card {{ border: 1px solid #ddd; padding: 15px; margin-bottom: 15px; border-radius: 8px; transition: opacity 0.3s; }}
-        .job-card.hidden {{ display: none; }}
-        .job-title {{ font-weight: bold; color: #333; margin-bottom: 5px; }}
-        .job-meta {{ color: #666; font-size: 0.9em; }}
-        .fresh-job {{ border-left: 4px solid #4CAF50; }}
-        .recent-job {{ border-left: 4px solid #FF9800; }}
-        .old-job {{ border-left: 4px solid #999; }}
-        a {{ color: #0066cc; text-decoration: none; }}
-        a:hover {{ text-decoration: underline; }}
-        .results-info {{ color: #666; font-style: italic; margin-bottom: 15px; }}
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background: #f0f8ff; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
+        .stats { display: flex; gap: 20px; margin-bottom: 20px; }
+        .stat-box { background: #fff; border: 1px solid #ddd; padding: 15px; border-radius: 8px; flex: 1; }
+        .filters { background: #f9f9f9; padding: 15px; border-radius: 8px; margin-bottom: 20px; }
+        .filter-group { display: flex; align-items: center; gap: 10px; margin-bottom: 10px; }
+        select { padding: 8px 12px; border: 1px solid #ddd; border-radius: 4px; font-size: 14px; }
+        .job-card { border: 1px solid #ddd; padding: 15px; margin-bottom: 15px; border-radius: 8px; transition: opacity 0.3s; }
+        .job-card.hidden { display: none; }
+        .job-title { font-weight: bold; color: #333; margin-bottom: 5px; }
+        .job-meta { color: #666; font-size: 0.9em; }
+        .fresh-job { border-left: 4px solid #4CAF50; }
+        .recent-job { border-left: 4px solid #FF9800; }
+        .old-job { border-left: 4px solid #999; }
+        a { color: #0066cc; text-decoration: none; }
+        a:hover { text-decoration: underline; }
+        .results-info { color: #666; font-style: italic; margin-bottom: 15px; }
     </style>
 </head>
 <body>
     <div class="header">
         <h1>🔎 Product Management Job Dashboard</h1>
-        <p>Last updated: {stats.get('last_run', 'Never')}</p>
+        <p>Last updated: $last_run</p>
     </div>
     
     <div class="stats">
         <div class="stat-box">
             <h3>📊 Total Jobs</h3>
-            <h2 id="total-jobs">{len(jobs)}</h2>
+            <h2 id="total-jobs">$total_jobs</h2>
         </div>
         <div class="stat-box">
             <h3>🏢 Companies</h3>
-            <h2>{len(stats.get('companies_scraped', {}))}</h2>
+            <h2>$companies_count</h2>
         </div>
         <div class="stat-box">
             <h3>🆕 Today's New Jobs</h3>
-            <h2>{len([j for j in jobs if j['date_found'] == datetime.now().strftime('%Y-%m-%d')])}</h2>
+            <h2>$todays_new_jobs</h2>
         </div>
     </div>
     
@@ -847,68 +1236,19 @@ def create_html_report(data_dir: Path):
         <div class="filter-group">
             <label for="company-filter"><strong>🏢 Filter by Company:</strong></label>
             <select id="company-filter" onchange="filterJobs()">
-                <option value="all">All Companies</option>"""
+                <option value="all">All Companies</option>""")
 
-        # Add company options
-        companies = sorted(set([job['company'] for job in jobs]))
-        for company in companies:
-            company_count = len([job for job in jobs if job['company'] == company])
-            html_content += f'<option value="{company}">{company} ({company_count})</option>'
-
-        html_content += f"""
+DASHBOARD_JOBS_HEADER_TEMPLATE = string.Template("""
             </select>
         </div>
-        <div class="results-info" id="results-info">Showing all {len(jobs)} jobs</div>
+        <div class="results-info" id="results-info">Showing all $total_jobs jobs</div>
     </div>
     
     <h2>📋 Latest Jobs</h2>
     <div id="jobs-container">
-"""
-        
-        # Add job cards (latest 50)
-        for job in jobs[:50]:
-            is_today = job['date_found'] == datetime.now().strftime('%Y-%m-%d')
-            
-            # Determine job freshness based on date_posted
-            job_class = "job-card"
-            freshness_emoji = ""
-            
-            if job.get('date_posted') and job['date_posted'] != 'Unknown':
-                try:
-                    posted_date = datetime.strptime(job['date_posted'], '%Y-%m-%d')
-                    days_ago = (datetime.now() - posted_date).days
-                    
-                    if days_ago <= 3:
-                        job_class += " fresh-job"
-                        freshness_emoji = "🆕"
-                    elif days_ago <= 14:
-                        job_class += " recent-job" 
-                        freshness_emoji = "📅"
-                    else:
-                        job_class += " old-job"
-                        freshness_emoji = "📰"
-                except:
-                    job_class += " job-card"
-            
-            elif is_today:  # Fallback to found date if posted date unavailable
-                job_class += " fresh-job"
-                freshness_emoji = "🆕"
-            
-            html_content += f"""
-    <div class="{job_class}" data-company="{job['company']}">
-        <div class="job-title">
-            <a href="{job['url']}" target="_blank">{job['title']}</a>
-            {freshness_emoji}
-        </div>
-        <div class="job-meta">
-            📍 {job['location']} | 🏢 {job['company']} | 
-            {'📅 Posted: ' + job.get('date_posted', 'Unknown') + ' | ' if job.get('date_posted') != 'Unknown' else ''}
-            🔍 Found: {job['date_found']} | Status: {job['status']}
-        </div>
-    </div>
-"""
-        
-        html_content += """
+""")
+
+DASHBOARD_FOOTER = """
     </div>
 
     <script>
@@ -950,14 +1290,117 @@ def create_html_report(data_dir: Path):
 </body>
 </html>
 """
+
+# Dashboard markup filled in per company option and per job card. Every job
+# field is HTML-escaped before substitution
+COMPANY_OPTION_TEMPLATE = '<option value="%(company)s">%(company)s (%(count)d)</option>'
+
+JOB_CARD_TEMPLATE = """
+    <div class="%(job_class)s" data-company="%(company)s">
+        <div class="job-title">
+            <a href="%(url)s" target="_blank">%(title)s</a>
+            %(freshness_emoji)s
+        </div>
+        <div class="job-meta">
+            📍 %(location)s | 🏢 %(company)s | 
+            %(posted)s
+            🔍 Found: %(date_found)s | Status: %(status)s
+        </div>
+    </div>
+"""
+
+
+@lru_cache(maxsize=64)
+def _job_freshness(date_posted: str, now: datetime) -> Tuple[str, str]:
+    """Classify a posting date as fresh/recent/old, returning the card class suffix and emoji.
+    Many jobs share a posting date, so results are cached per (date_posted, now)"""
+    try:
+        # Dates are stored as YYYY-MM-DD, which the C-level ISO parser
+        # handles without strptime's regex machinery
+        days_ago = (now - datetime.fromisoformat(date_posted)).days
+    except (TypeError, ValueError):
+        return "", ""
+    
+    if days_ago <= 3:
+        return " fresh-job", "🆕"
+    elif days_ago <= 14:
+        return " recent-job", "📅"
+    return " old-job", "📰"
+
+
+def create_html_report(data_dir: Path, jobs: Optional[List[Dict]] = None, stats: Optional[Dict] = None):
+    """Create a simple HTML report, reading jobs/stats from data_dir unless given"""
+    try:
+        if jobs is None:
+            with open(data_dir / "jobs.json", 'r') as f:
+                jobs = json.load(f)
+        
+        if stats is None:
+            with open(data_dir / "stats.json", 'r') as f:
+                stats = json.load(f)
+        
+        # Freshness is judged against one moment for the whole report
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        
+        # Jobs per discovery date, tallied in one pass
+        found_date_counts = Counter(job['date_found'] for job in jobs)
+        
+        # Pieces of the page, joined once at the end
+        html_parts = [DASHBOARD_HEADER_TEMPLATE.substitute(
+            last_run=html.escape(str(stats.get('last_run', 'Never'))),
+            total_jobs=len(jobs),
+            companies_count=len(stats.get('companies_scraped', {})),
+            todays_new_jobs=found_date_counts[today]
+        )]
+
+        # Add company options, counting every company's jobs in one pass
+        company_counts = Counter(job['company'] for job in jobs)
+        for company in sorted(company_counts):
+            html_parts.append(COMPANY_OPTION_TEMPLATE % {
+                'company': html.escape(company),
+                'count': company_counts[company]
+            })
+
+        html_parts.append(DASHBOARD_JOBS_HEADER_TEMPLATE.substitute(total_jobs=len(jobs)))
+        
+        # Add job cards (latest 50)
+        for job in jobs[:50]:
+            date_posted = job.get('date_posted', 'Unknown')
+            is_today = job['date_found'] == today
+            
+            # Determine job freshness based on date_posted
+            job_class = "job-card"
+            freshness_emoji = ""
+            
+            if date_posted and date_posted != 'Unknown':
+                class_suffix, freshness_emoji = _job_freshness(date_posted, now)
+                job_class += class_suffix
+            
+            elif is_today:  # Fallback to found date if posted date unavailable
+                job_class += " fresh-job"
+                freshness_emoji = "🆕"
+            
+            card = {
+                field: html.escape(str(job[field]))
+                for field in ('company', 'title', 'location', 'url', 'date_found', 'status')
+            }
+            card['job_class'] = job_class
+            card['freshness_emoji'] = freshness_emoji
+            card['posted'] = (
+                '📅 Posted: ' + html.escape(str(date_posted)) + ' | '
+                if date_posted != 'Unknown' else ''
+            )
+            html_parts.append(JOB_CARD_TEMPLATE % card)
+        
+        html_parts.append(DASHBOARD_FOOTER)
         
-        with open(data_dir / "dashboard.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        write_file_atomically(data_dir / "dashboard.html", ''.join(html_parts))
         
         logger.info("📊 HTML dashboard created: data/dashboard.html")
         
     except Exception as e:
-        logger.error(f"Error creating HTML report: {e}")
+        logger.error("Error creating HTML report: %s", e)
 
 
 def main():